@@ -11,7 +11,71 @@ __email__      = "contact@amartos.fr"
 __copyright__  = "Copyright 2023 " + __author__ + " <{}>".format(__email__)
 __status__     = "Production"
 
-import sys, argparse
+import sys, argparse, re
+from array import array
+from itertools import groupby
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Bytecode operations codes.
+ADD, MOVE, OUTPUT, INPUT, OPEN, CLOSE, CLEAR, SCAN, MULADD = range(9)
+
+# Matches the comments and the non-BrainFuck characters.
+CODE_RE = re.compile(r"#[^\n]*|[^+\-<>.,\[\]]")
+
+def loop(code, args, jumps, mem, pc, sr, inslen):
+    """Execute the bytecode until an instruction needs the interpreter.
+
+    Only the instructions that neither do IO nor need the memory to be
+    extended are executed; the function returns as soon as another
+    one is reached, without executing it. It is meant to be compiled
+    with numba (see jitLoop).
+
+    Args:
+        code: The bytecode operations codes.
+        args: The bytecode operations arguments.
+        jumps: The loops siblings jump table.
+        mem: The memory bytearray.
+        pc: The index of the first instruction to execute.
+        sr: The pointer value.
+        inslen: The index of the instruction to stop at.
+
+    Returns:
+        The index of the next instruction to execute and the pointer
+        value, as a tuple.
+    """
+
+    memlen = len(mem)
+    while pc < inslen:
+        op = code[pc]
+        if op == ADD:
+            mem[sr] = (mem[sr] + args[pc]) & 0xFF
+            pc += 1
+        elif op == MOVE:
+            if sr + args[pc] < 0 or sr + args[pc] >= memlen: break
+            sr += args[pc]
+            pc += 1
+        elif op == OPEN:
+            pc = jumps[pc] if mem[sr] == 0 else pc + 1
+        elif op == CLOSE:
+            pc = jumps[pc] if mem[sr] != 0 else pc + 1
+        elif op == CLEAR:
+            mem[sr] = 0
+            pc += 1
+        elif op == SCAN:
+            i = sr
+            while i >= 0 and i < memlen and mem[i] != 0: i += args[pc]
+            if i < 0 or i >= memlen: break
+            sr  = i
+            pc += 1
+        else: break
+    return pc, sr
+
+# The compilation result is cached on disk, as it takes a few seconds.
+jitLoop = njit(cache=True)(loop) if njit is not None else None
 
 class BrainFuckingGoneError(Exception):
     """Interpreter exceptions."""
@@ -32,27 +96,68 @@ class BrainFuckingGone:
 
         self.count  = 0
         self.memmax = 30 * 1000
-        self.minmax = [0,255]
+        # Outside of strict mode, the memory grows by chunks.
+        self.memchk = 4 * 1024
         self.errmsg = "{} at instruction #{} ('{}'): {}"
         self.stdout = None
+        self.outbuf = bytearray()
         self.remain = None
-        self.ins    = None
+        self.remIdx = 0
+        self.code   = None
+        self.args   = None
+        self.jumps  = None
+        self.muls   = None
         self.inslen = 0
+        self.runlen = 0
+        self.srclen = 0
+        self.opened = []
         self.keep   = False
         self.strict = False
         self.debug  = False
         self.keep   = False
         self.lang   = {
-            "loops": { "left": "[", "right": "]", "func": self.loop  },
-            "ptrs":  { "left": "<", "right": ">", "func": self.ptr   },
-            "bytes": { "left": "-", "right": "+", "func": self.byte  },
-            "ios":   { "left": ",", "right": ".", "func": self.inout },
-            "comments": { "left": "#", "right": "\n", "func": self.ignoreUntil }
+            "loops": { "left": "[", "right": "]" },
+            "ptrs":  { "left": "<", "right": ">" },
+            "bytes": { "left": "-", "right": "+" },
+            "ios":   { "left": ",", "right": "." },
+            "comments": { "left": "#", "right": "\n" }
         }
-        self.action = {}
+        # The symbols never change, thus are cached as attributes
+        # named after their category and side (e.g. self.loopsLeft).
         for k,i in self.lang.items():
-            self.action[i.get("left")]  = i.get("func")
-            self.action[i.get("right")] = i.get("func")
+            for side, char in i.items():
+                setattr(self, k + side.capitalize(), char)
+        self.opcode = {
+            self.bytesRight: ADD,    self.bytesLeft: ADD,
+            self.ptrsRight:  MOVE,   self.ptrsLeft:  MOVE,
+            self.iosRight:   OUTPUT, self.iosLeft:   INPUT,
+            self.loopsLeft:  OPEN,   self.loopsRight: CLOSE,
+        }
+        # The (left, right) symbols of each operation code.
+        self.oplang = {
+            ADD:    (self.bytesLeft, self.bytesRight),
+            MOVE:   (self.ptrsLeft,  self.ptrsRight),
+            OUTPUT: (self.iosLeft,   self.iosRight),
+            INPUT:  (self.iosLeft,   self.iosRight),
+            OPEN:   (self.loopsLeft, self.loopsRight),
+            CLOSE:  (self.loopsLeft, self.loopsRight),
+            CLEAR:  (self.bytesLeft, self.bytesRight),
+            SCAN:   (self.ptrsLeft,  self.ptrsRight),
+        }
+        # Indexed by operation code. Each handler takes the
+        # instruction index and argument, and returns the index of the
+        # next instruction to execute.
+        self.action = (
+            self.add,      # ADD
+            self.move,     # MOVE
+            self.putc,     # OUTPUT
+            self.getc,     # INPUT
+            self.loopOpen, # OPEN
+            self.loopClose,# CLOSE
+            self.clear,    # CLEAR
+            self.scan,     # SCAN
+            self.muladd    # MULADD
+        )
 
     def run(self, files = None, persistent = False, debug = False, strict = False):
         """Run the interpreter.
@@ -75,22 +180,29 @@ class BrainFuckingGone:
             # persistence. But we do not want to wait for the output,
             # thus it is not delayed in this case.
             self.debug  = debug or shell
-            self.stdout = None if not self.debug or shell else ""
+            self.stdout = None if not self.debug or shell else bytearray()
             self.keep   = persistent or shell
-            programs    = self.script(files)
 
         self.reset(True)
-        self.ins = ""
-        while(shell or len(files) > 0):
-            if shell: self.ins = self.shell()
-            else:
-                self.ins = self.script(files)
-                files    = files[1:]
-            if self.ins is not None:
+        if shell:
+            # Each line is compiled after the previous ones, and the
+            # execution goes on from where it stopped.
+            prog = self.shell()
+            while(prog is not None):
+                self.compile(prog, append=True)
+                self.execute()
+                prog = self.shell()
+        else:
+            # In persistent mode, the scripts are run as a single
+            # program.
+            for paths in ([files] if self.keep else ([p] for p in files)):
+                self.compile(self.script(paths))
                 self.execute()
         if self.stdout is not None:
             print("Output:", file=sys.stderr)
-            print(self.stdout)
+            self.outbuf.extend(self.stdout)
+            self.outbuf.append(10)
+            self.flush()
         else:
             print() # ensure last print is a newline
 
@@ -105,53 +217,207 @@ class BrainFuckingGone:
         self.buf = None
         if force or not self.keep:
             self.count  = 0
-            self.ins    = None
-            self.loops  = {}
+            self.code   = None
+            self.args   = None
+            self.jumps  = None
+            self.muls   = None
             self.sr     = 0
             self.pc     = 0
-            self.mem    = [0] * (1 if not self.strict else self.memmax)
+            self.mem    = bytearray(self.memchk if not self.strict else self.memmax)
             # reduce len() calls
             self.inslen = 0
+            self.runlen = 0
+            self.srclen = 0
+            self.opened = []
             self.memlen = self.memmax if self.strict else len(self.mem)
 
     def script(self, paths):
-        """Return the first BrainFuck program from the given scripts paths.
+        """Return the BrainFuck program made of the given scripts.
 
         Args:
             paths: A list of file paths pointing to text files
                 containing BrainFuck code.
 
         Returns:
-            None if no program is found, else the program.
+            None if no program is found, else the program stripped
+            of its comments and non-BrainFuck characters.
         """
 
         prog = None
         if paths and len(paths) > 0:
-            prog = ""
-            if not self.keep: paths = paths[:1]
+            parts = []
             for p in paths:
                 with open(p, "r") as f:
-                    prog = prog + "".join(
-                        [
-                            l.strip().split(self.lang.get("comments").get("left"))[0]
-                            for l in f.readlines()
-                            if not l.startswith(self.lang.get("comments").get("left"))
-                        ]
-                    )
-            self.inslen = len(prog)
+                    parts.append(self.clean(f.read()))
+            prog = "".join(parts)
         return prog
 
+    def clean(self, text):
+        """Strip comments and non-BrainFuck characters from a text.
+
+        Args:
+            text: The text to clean.
+
+        Returns:
+            The BrainFuck instructions contained in the text.
+        """
+
+        return CODE_RE.sub("", text)
+
+    def compile(self, prog, append=False):
+        """Lower a BrainFuck program to bytecode.
+
+        The bytecode is stored in two parallel arrays: self.code holds
+        the operations codes, and self.args their argument. Runs of
+        consecutive '+'/'-' are fused into a single ADD operation, and
+        runs of '<' or of '>' into a single MOVE operation, whose
+        arguments are the net value and pointer changes. The ADD runs
+        are dropped if their net change is null. The pointer runs are
+        not fused across a change of direction, as the move back could
+        hide a segfault.
+
+        The loops are matched at the same time: self.jumps gives, for
+        each loop start and end, the index of the instruction following
+        its sibling. Loops that are known idioms are replaced by a
+        single instruction (see self.fuse).
+
+        The program can be appended to the current bytecode, in which
+        case the loops left open are kept in self.opened, as
+        (instruction index, source position) pairs, to be matched by
+        the next programs. Only the instructions before the first of
+        these loops can be executed, and their count is stored in
+        self.runlen. The source positions continue from the previous
+        programs, whose total length is kept in self.srclen.
+
+        Args:
+            prog: A BrainFuck program without comments.
+            append: A boolean indicating to append the program to the
+                current bytecode.
+
+        Raises:
+            BrainFuckingGoneError: if a dangling loop character is
+              detected.
+        """
+
+        if not append or self.code is None:
+            self.code   = array("b")
+            self.args   = array("i")
+            self.jumps  = array("i")
+            self.muls   = []
+            self.opened = []
+            self.srclen = 0
+        stack = self.opened
+        # The position in the source, for errors messages.
+        pos   = self.srclen
+        for op, chars in groupby(prog, key=self.opcode.get):
+            if op == ADD or op == MOVE:
+                right = self.bytesRight if op == ADD else self.ptrsRight
+                runs  = (chars,) if op == ADD else (run for c, run in groupby(chars))
+                for run in runs:
+                    count = 0
+                    for c in run:
+                        count += 1 if c == right else -1
+                        pos   += 1
+                    if count:
+                        self.code.append(op)
+                        self.args.append(count)
+                        self.jumps.append(0)
+            else:
+                for c in chars:
+                    pc   = len(self.code)
+                    jump = 0
+                    pos += 1
+                    if op == OPEN: stack.append((pc, pos - 1))
+                    elif op == CLOSE:
+                        if not stack:
+                            raise BrainFuckingGoneError("Syntax error: dangling '{}' at position {}.".format(c, pos - 1))
+                        sibling = stack.pop()[0]
+                        if self.fuse(sibling): continue
+                        self.jumps[sibling] = pc + 1
+                        jump = sibling + 1
+                    self.code.append(op)
+                    self.args.append(0)
+                    self.jumps.append(jump)
+        if stack and not append:
+            raise BrainFuckingGoneError(
+                "Syntax error: dangling '{}' at position {}.".format(self.loopsLeft, stack[-1][1])
+            )
+        self.inslen = len(self.code)
+        self.runlen = stack[0][0] if stack else self.inslen
+        self.srclen = pos
+
+    def fuse(self, start):
+        """Replace a loop idiom by a single instruction.
+
+        The loop body is the compiled code following the start index,
+        the loop end not being compiled yet. The recognized idioms
+        are:
+        - '[-]' and '[+]', which clear the byte (CLEAR);
+        - '[<]' and '[>]', which move the pointer until a null byte is
+          found (SCAN), for any fused pointer increment;
+        - loops made only of '+-<>' that go back to their starting byte
+          and change it by 1 at each iteration, such as '[->+<]' or
+          '[->++>+<<]', which add multiples of the byte to other bytes
+          and clear it (MULADD). Their argument is an index in
+          self.muls, which holds a (cells, low, high, step, symbol)
+          tuple for each of them: cells are the (offset, multiplier)
+          pairs of the modified bytes, low and high the extreme
+          visited offsets, step the change of the starting byte, and
+          symbol the loop debugging symbol.
+
+        Args:
+            start: The index of the loop start instruction.
+
+        Returns:
+            True if the loop has been replaced, False otherwise.
+        """
+
+        ops   = self.code[start + 1:]
+        args  = self.args[start + 1:]
+        fused = None
+        arg   = args[0] if args else 0
+        if len(ops) == 1:
+            if   ops[0] == ADD and abs(arg) == 1: fused = CLEAR
+            elif ops[0] == MOVE: fused = SCAN
+        elif ops and all(op == ADD or op == MOVE for op in ops):
+            offset = low = high = 0
+            cells  = {}
+            for op, n in zip(ops, args):
+                if op == MOVE:
+                    offset += n
+                    low     = min(low, offset)
+                    high    = max(high, offset)
+                else: cells[offset] = cells.get(offset, 0) + n
+            step = cells.pop(0, 0)
+            if offset == 0 and abs(step) == 1:
+                symbol = "".join(self.symbol(pc) for pc in range(start + 1, len(self.code)))
+                symbol = self.loopsLeft + symbol + self.loopsRight
+                cells  = tuple((o, m) for o, m in cells.items() if m & 0xFF)
+                fused  = MULADD
+                arg    = len(self.muls)
+                self.muls.append((cells, low, high, step, symbol))
+        if fused is None: return False
+
+        del self.code[start:]
+        del self.args[start:]
+        del self.jumps[start:]
+        self.code.append(fused)
+        self.args.append(arg)
+        self.jumps.append(0)
+        return True
+
     def shell(self):
         """Retrieve a piece of BrainFuck program from an interactive shell.
 
         Returns:
-            None if no program is given, else the program.
+            None if no program is given (EOF), else the new piece
+            of program, stripped of its comments and non-BrainFuck
+            characters.
         """
 
         prog = None
         if self.inp(isInstruction=True):
-            prog = (self.ins if self.ins else "") + (self.buf if self.buf else "")
-            self.inslen += len(self.buf if self.buf else "")
+            prog = self.clean(self.buf if self.buf else "")
             self.buf = None
         return prog
 
@@ -163,59 +429,113 @@ class BrainFuckingGone:
                 through a shell.
         """
 
-        while(True):
-            # self.dbg will always return None, but is better used
-            # between the instruction and jump.
-            if self.translate() or self.dbg() or not self.jump(): break
-        if not shell: self.dbg(True)
+        # The output given before an error must not be lost.
+        try:
+            if self.debug: self.trace()
+            else: self.fast()
+        finally:
+            self.flush()
+        if not shell: self.dbg(report=True)
         self.reset()
 
-    def translate(self):
-        """Execute the current BrainFuck instruction.
+    def trace(self):
+        """Execute the program printing debugging informations.
 
-        Returns:
-            non-True if the program can continue, True otherwise.
+        Each instruction is executed through its handler, and followed
+        by a debugging print.
         """
 
-        action = self.action.get(self.instruction())
-        if action: return action()
+        while(self.pc < self.runlen):
+            pc      = self.pc
+            self.pc = self.action[self.code[pc]](pc, self.args[pc])
+            self.dbg(pc)
 
-    def instruction(self, pc=None):
-        """Give the current BrainFuck instruction.
+    def fast(self):
+        """Execute the program as fast as possible.
 
-        Args:
-            pc: The instruction index in the program.
-
-        Returns:
-            The current BrainFuck instruction symbol.
+        No debugging information is gathered, not even the steps
+        count, as it is only reported in debug mode.
         """
 
-        pc = pc if pc else self.pc
-        if pc < self.inslen: return self.ins[pc]
+        # The instance attributes are copied into local variables, as
+        # they are much faster to access. The most frequent
+        # instructions are executed inline (or by the numba compiled
+        # loop if available), and the others through their handler,
+        # for which the pointer value is kept in sync.
+        code   = self.code
+        args   = self.args
+        jumps  = self.jumps
+        action = self.action
+        mem    = self.mem
+        memlen = self.memlen
+        inslen = self.runlen
+        pc     = self.pc
+        sr     = self.sr
+        while(jitLoop is not None and pc < inslen):
+            pc, sr = jitLoop(code, args, jumps, mem, pc, sr, inslen)
+            if pc < inslen:
+                self.sr = sr
+                pc      = action[code[pc]](pc, args[pc])
+                sr      = self.sr
+        while(pc < inslen):
+            op = code[pc]
+            if op == ADD:
+                mem[sr] = (mem[sr] + args[pc]) & 0xFF
+                pc += 1
+            elif op == MOVE:
+                sr += args[pc]
+                if sr < 0 or sr >= memlen:
+                    self.sr = sr
+                    self.segflt(pc)
+                    memlen = self.memlen
+                pc += 1
+            elif op == OPEN:
+                pc = jumps[pc] if not mem[sr] else pc + 1
+            elif op == CLOSE:
+                pc = jumps[pc] if mem[sr] else pc + 1
+            else:
+                self.sr = sr
+                pc      = action[op](pc, args[pc])
+                sr      = self.sr
+                memlen  = self.memlen
+        self.pc = pc
+        self.sr = sr
+
+    def symbol(self, pc=None):
+        """Give the BrainFuck symbol of the current instruction.
 
-    def jump(self, to=None):
-        """Go to the next valid instruction.
+        Fused instructions are prefixed by their repetitions count,
+        and fused loops are enclosed in the loop symbols.
 
         Args:
-            to: The position to jump to as an integer between
-              [0, program len). Default to the current position +1.
+            pc: The instruction index in the program.
 
         Returns:
-            False if the end of the program is reached, else True.
+            The current BrainFuck instruction symbol.
         """
 
-        self.pc = to if to is not None else self.pc + 1
-        return self.pc < self.inslen
-
-    def dbg(self, report=False):
+        pc   = pc if pc is not None else self.pc
+        op   = self.code[pc]
+        arg  = self.args[pc]
+        if op == MULADD: return self.muls[arg][-1]
+        side = 1 if op in (OUTPUT, CLOSE) or arg > 0 else 0
+        char = self.oplang.get(op)[side]
+        char = char if abs(arg) <= 1 else "{}{}".format(abs(arg), char)
+        if op in (CLEAR, SCAN):
+            char = self.loopsLeft + char + self.loopsRight
+        return char
+
+    def dbg(self, pc=None, report=False):
         """Print debugging informations.
 
         Args:
+            pc: The index of the instruction that has just been
+                executed.
             report: A boolean making the function print a report on
                 the BrainFuck program.
         """
 
-        self.count += 1
+        if not report: self.count += 1
         if self.debug:
             if report:
                 print(
@@ -224,10 +544,10 @@ class BrainFuckingGone:
                     ),
                     file = sys.stderr
                 )
-            elif self.instruction():
+            else:
                 print(
                     "PC: {:3} ('{}'), PTR: *({:2}) = {:3}".format(
-                        self.pc, self.instruction(), self.sr, self.value()
+                        pc, self.symbol(pc), self.sr, self.value()
                     ),
                     file = sys.stderr
                 )
@@ -249,88 +569,158 @@ class BrainFuckingGone:
         if value is not None: self.mem[self.sr] = value
         else: return self.mem[self.sr]
 
-    def loop(self):
-        """Handle loops."""
+    def loopOpen(self, pc, arg):
+        """Jump after the matching loop end if the byte value is null.
+
+        Args:
+            pc: The instruction index.
+            arg: The instruction argument (unused).
 
-        if self.loops.get(self.pc) is None: self.registerLoop()
+        Returns:
+            The index of the next instruction.
+        """
 
-        if not (bool(self.value()) ^ (self.instruction() == self.lang.get("loops").get("right"))):
-            self.jump(self.loops.get(self.pc))
+        return self.jumps[pc] if not self.mem[self.sr] else pc + 1
 
-    def registerLoop(self):
-        """Register loops start and end positions.
+    def loopClose(self, pc, arg):
+        """Jump after the matching loop start if the byte value is not null.
 
-        Raises:
-            BrainFuckingGoneError: if a dangling loop character is
-              detected.
+        Args:
+            pc: The instruction index.
+            arg: The instruction argument (unused).
+
+        Returns:
+            The index of the next instruction.
+        """
+
+        return self.jumps[pc] if self.mem[self.sr] else pc + 1
+
+    def clear(self, pc, arg):
+        """Set the byte value to 0.
+
+        Args:
+            pc: The instruction index.
+            arg: The instruction argument (unused).
+
+        Returns:
+            The index of the next instruction.
+        """
+
+        self.mem[self.sr] = 0
+        return pc + 1
+
+    def scan(self, pc, arg):
+        """Move the pointer until a null byte is found.
+
+        Args:
+            pc: The instruction index.
+            arg: The pointer increment of each step.
+
+        Returns:
+            The index of the next instruction.
+        """
+
+        if arg == 1:
+            sr = self.mem.find(0, self.sr)
+            self.sr = sr if sr >= 0 else self.memlen
+        elif arg == -1:
+            self.sr = self.mem.rfind(0, 0, self.sr + 1)
+        else:
+            while(self.mem[self.sr]):
+                self.sr += arg
+                self.segflt(pc)
+        self.segflt(pc)
+        return pc + 1
+
+    def muladd(self, pc, arg):
+        """Add multiples of the byte value to other bytes, and clear it.
+
+        Args:
+            pc: The instruction index.
+            arg: The index of the instruction parameters in self.muls.
+
+        Returns:
+            The index of the next instruction.
+        """
+
+        value = self.mem[self.sr]
+        if value:
+            cells, low, high, step, symbol = self.muls[arg]
+            # The loop runs value times if the byte is decremented,
+            # and until it overflows otherwise.
+            count = value if step < 0 else 0x100 - value
+            self.segflt(pc, self.sr + low)
+            self.segflt(pc, self.sr + high)
+            for offset, mult in cells:
+                sr = self.sr + offset
+                self.mem[sr] = (self.mem[sr] + count * mult) & 0xFF
+            self.mem[self.sr] = 0
+        return pc + 1
+
+    def move(self, pc, arg):
+        """Increment or decrement the pointer value.
+
+        Args:
+            pc: The instruction index.
+            arg: The pointer increment.
+
+        Returns:
+            The index of the next instruction.
         """
 
-        isEnd = self.instruction() == self.lang.get("loops").get("right")
-        char  = self.lang.get("loops").get("left" if isEnd else "right")
-        start = self.pc+1
-        end   = 0 if isEnd else self.inslen
-        step  = -1 if isEnd else 1
-
-        sibling = None
-        count = 0
-        for i in range(start, end, step):
-            if self.instruction(i) == self.instruction():
-                count += 1
-            elif self.instruction(i) == char:
-                if count > 0: count -= 1
-                else:
-                    sibling = i
-                    break
-
-        if sibling is None:
-            raise BrainFuckingGoneError("Syntax error: dangling '{}' at position {}.".format(self.instruction(), self.pc))
-        self.loops[self.pc] = sibling
-        self.loops[sibling] = self.pc
-
-    def ptr(self):
-        """Increment or decrement the pointer value."""
-
-        if   self.instruction() == self.lang.get("ptrs").get("left"):  self.sr -= 1
-        elif self.instruction() == self.lang.get("ptrs").get("right"): self.sr += 1
-        self.segflt()
-
-    def segflt(self):
-        """Check for segfaults errors and raise them if any."""
-
-        if self.sr >= self.memlen:
+        self.sr += arg
+        self.segflt(pc)
+        return pc + 1
+
+    def segflt(self, pc, sr=None):
+        """Check for segfaults errors and raise them if any.
+
+        Args:
+            pc: The index of the instruction moving the pointer.
+            sr: The pointer value to check. Default to the current
+                pointer value.
+        """
+
+        sr = sr if sr is not None else self.sr
+        if sr >= self.memlen:
             if self.strict:
                 raise BrainFuckingGoneError(
                     self.errmsg.format(
-                        "Segfault", self.pc, self.instruction(),
+                        "Segfault", pc, self.symbol(pc),
                         "data pointer value above the maximum (strict mode: on)"
                     ))
             else:
-                self.mem.append(0)
-                self.memlen += 1
-        elif self.sr < 0:
+                self.mem.extend(bytes(max(self.memchk, sr - self.memlen + 1)))
+                self.memlen = len(self.mem)
+        elif sr < 0:
             raise BrainFuckingGoneError(
                 self.errmsg.format(
-                    "Segfault", self.pc, self.instruction(),
+                    "Segfault", pc, self.symbol(pc),
                     "negative data pointer value"
                 ))
 
-    def byte(self):
-        """Increment or decrement the byte value with over/underflow."""
+    def add(self, pc, arg):
+        """Increment or decrement the byte value with over/underflow.
 
-        newValue = self.value()
-        if   self.instruction() == self.lang.get("bytes").get("left"):  newValue -= 1
-        elif self.instruction() == self.lang.get("bytes").get("right"): newValue += 1
+        Args:
+            pc: The instruction index.
+            arg: The byte value increment.
 
-        # Over/underflow.
-        if   newValue < self.minmax[0]: newValue = self.minmax[1] - abs(newValue) + 1
-        elif newValue > self.minmax[1]: newValue = self.minmax[0] + abs(newValue) - 1
+        Returns:
+            The index of the next instruction.
+        """
 
-        self.value(newValue)
+        # Over/underflow.
+        self.mem[self.sr] = (self.mem[self.sr] + arg) & 0xFF
+        return pc + 1
 
     def inp(self, prompt=" > ", isInstruction=False):
         """Ask for input.
 
-        The input value is stored in the self.buf variable.
+        The input value is stored in the self.buf variable. The
+        characters of an input line are given one at a time, the
+        remaining ones being kept in self.remain from the index
+        self.remIdx.
 
         Args:
             prompt: The prompt to show to the user.
@@ -344,45 +734,78 @@ class BrainFuckingGone:
                 self.buf = input(prompt)
                 return True
             elif self.remain is not None:
-                self.buf = self.remain[0]
-                self.remain = self.remain[1:]
-                if len(self.remain) == 0:
+                self.buf     = self.remain[self.remIdx]
+                self.remIdx += 1
+                if self.remIdx >= len(self.remain):
                     self.remain = None
                 return True
             else:
                 self.remain = input()
+                self.remIdx = 0
                 return self.inp()
         except EOFError:
             return False
 
-    def inout(self):
-        """Handle IO.
+    def putc(self, pc, arg):
+        """Output the byte value.
+
+        Args:
+            pc: The instruction index.
+            arg: The instruction argument (unused).
 
         Returns:
-            True if the program must stop (EOF from the user), None otherwise.
+            The index of the next instruction.
+        """
+
+        value = self.mem[self.sr]
+        if self.stdout is not None:
+            self.stdout.append(value)
+        elif not self.debug:
+            self.outbuf.append(value)
+            if value == 10 or len(self.outbuf) >= 4096: self.flush()
+        else:
+            # Each output gets its own line among the debugging ones.
+            self.outbuf.append(value)
+            self.outbuf.append(10)
+            self.flush()
+        return pc + 1
+
+    def flush(self):
+        """Write the buffered output bytes to the standard output.
+
+        The bytes are written as is, or decoded as latin-1 if the
+        standard output is a text stream without an underlying
+        binary buffer.
         """
 
-        if self.instruction() == self.lang.get("ios").get("right"):
-            output = chr(self.value())
-            if self.debug and self.stdout is not None:
-                self.stdout = self.stdout + output
+        if self.outbuf:
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                sys.stdout.write(self.outbuf.decode("latin-1"))
             else:
-                print(output, end="" if not self.debug else "\n")
-        elif self.instruction() == self.lang.get("ios").get("left"):
-            if not self.inp("\n?> "): return True
-            self.value(ord(self.buf))
-            self.buf = None
+                # Pending text must be written first to keep the order.
+                sys.stdout.flush()
+                buffer.write(self.outbuf)
+                buffer.flush()
+            self.outbuf.clear()
 
-    def ignoreUntil(self, until=None):
-        """Ignore a region of instructions
+    def getc(self, pc, arg):
+        """Set the byte value with input.
 
         Args:
-            until: The ending limit character of the region to ignore
-                (default to the right side of comments)
+            pc: The instruction index.
+            arg: The instruction argument (unused).
+
+        Returns:
+            The index of the next instruction, or the program length
+            if the program must stop (EOF from the user).
         """
 
-        until = until if until is not None else self.lang.get("comments").get("right")
-        while(self.instruction() != until and self.jump()): pass
+        self.flush()
+        if not self.inp("\n?> "): return self.runlen
+        self.value(ord(self.buf))
+        self.buf = None
+        return pc + 1
 
 if __name__ == "__main__":
     bfg = BrainFuckingGone()
@@ -411,7 +834,7 @@ if __name__ == "__main__":
     parser.add_argument(
         "-s", "--strict",
         action="store_true",
-        help="use 'strict' mode: memory limited to {} bytes".format(bfg.memmax, bfg.minmax)
+        help="use 'strict' mode: memory limited to {} bytes".format(bfg.memmax)
     )
     parser.add_argument(
         "-f", "--file", action="append",